@@ -5,13 +5,20 @@ A Python package for converting Instagram cooking reels into structured recipes.
 
 from .converter import ConvertReelToRecipe
 from .transcribe_audio import TranscribeAudio, ModelSize
+from .transcript import Transcript, load_transcripts
 from .generate_recipe_with_ai import generate_recipe_with_gemini, GeminiModel
+from .nutrition import NutritionTable, compute_nutritional_summary, load_nutrition_table
 
 __version__ = "0.1.0"
 __all__ = [
     "ConvertReelToRecipe",
     "TranscribeAudio",
     "ModelSize",
+    "Transcript",
+    "load_transcripts",
     "generate_recipe_with_gemini",
     "GeminiModel",
+    "NutritionTable",
+    "compute_nutritional_summary",
+    "load_nutrition_table",
 ]
@@ -29,11 +29,16 @@ def main():
         "--output",
         help="Output file path (default: <shortcode>.json)"
     )
+    parser.add_argument(
+        "--local-nutrition",
+        action="store_true",
+        help="Compute nutrition locally instead of asking the AI model"
+    )
     
     args = parser.parse_args()
     
     try:
-        converter = ConvertReelToRecipe()
+        converter = ConvertReelToRecipe(local_nutrition=args.local_nutrition)
         print(f"Converting reel: {args.url}")
         
         recipe = converter.convert_to_recipe_from_reel_url(
@@ -7,9 +7,11 @@ import requests
 import instaloader
 
 from . import prompt
+from . import nutrition
 from . import generate_recipe_with_ai
 from . import convert_video_to_audio
 from . import transcribe_audio
+from . import transcript as transcript_store
 
 
 class ConvertReelToRecipe:
@@ -20,12 +22,23 @@ class ConvertReelToRecipe:
     transcribing the audio, and generating a recipe using AI.
     """
     
-    def __init__(self):
-        """Initialize the converter with default settings."""
+    def __init__(self, local_nutrition=False):
+        """
+        Initialize the converter with default settings.
+        
+        Args:
+            local_nutrition: If True, compute the nutritional summary locally from
+                the ingredients instead of asking the AI model for it
+        """
+        self.local_nutrition = local_nutrition
         # Store the prompt template from prompt.py
-        self.prompt_template = prompt.RECIPE_GENERATION_PROMPT
+        if local_nutrition:
+            self.prompt_template = prompt.RECIPE_GENERATION_PROMPT_WITHOUT_NUTRITION
+        else:
+            self.prompt_template = prompt.RECIPE_GENERATION_PROMPT
         self.prompt = None  # Will hold the last formatted prompt
         self.transcript = None
+        self.segments = None  # Transcript with per-segment details
         self.description = None
         self.shortcode = None
         
@@ -109,21 +122,36 @@ class ConvertReelToRecipe:
         """
         Transcribes audio from a given audio file path.
         
+        The segments and reel description are also saved to
+        `<shortcode>.transcript.json` so the prompt input can be rebuilt later
+        without transcribing again.
+        
         Args:
             audio_path: Path to the audio file
             
         Returns:
             str: Transcribed text
         """
-        ta = transcribe_audio.TranscribeAudio(
-            model_size=transcribe_audio.ModelSize.MEDIUM.value
-        )
-        transcription = ta.transcribe(audio_path)
+        try:
+            ta = transcribe_audio.TranscribeAudio(
+                model_size=transcribe_audio.ModelSize.MEDIUM.value
+            )
+            self.segments = ta.transcribe_segments(audio_path)
+        finally:
+            # Clean up audio file after transcription
+            if os.path.exists(audio_path):
+                os.remove(audio_path)
+        
+        self.segments.description = self.description
+        transcription = self.segments.to_text()
         self.transcript = transcription
         
-        # Clean up audio file after transcription
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+        if self.shortcode:
+            output_filename = transcript_store.transcript_path(self.shortcode)
+            try:
+                self.segments.save(output_filename)
+            except OSError as e:
+                print(f"Warning: Could not save transcript to {output_filename}: {e}")
             
         return transcription
     
@@ -145,6 +173,29 @@ class ConvertReelToRecipe:
         self.prompt = formatted
         return formatted
 
+    def build_prompt_from_segments(self, segments, description=None, min_avg_logprob=None,
+                                   max_no_speech_prob=None):
+        """
+        Format the prompt from stored segments, dropping unreliable ones.
+        
+        Args:
+            segments: Transcript with per-segment details
+            description: Instagram reel description/caption (default: the one
+                stored with the segments)
+            min_avg_logprob: Drop segments with a lower average log probability
+            max_no_speech_prob: Drop segments with a higher no-speech probability
+            
+        Returns:
+            str: Formatted prompt ready for AI
+        """
+        if description is None:
+            description = segments.description or ""
+        filtered = segments.filter(
+            min_avg_logprob=min_avg_logprob,
+            max_no_speech_prob=max_no_speech_prob
+        )
+        return self.build_prompt(description=description, transcript=filtered.to_text())
+
     def generate_recipe(self, ai_model=None, api_key=None):
         """
         Generates a recipe JSON string based on transcript and description.
@@ -172,6 +223,12 @@ class ConvertReelToRecipe:
         # Try to save as JSON
         try:
             recipe_json = json.loads(recipe_text)
+            if self.local_nutrition:
+                if isinstance(recipe_json, dict):
+                    recipe_json = self.add_nutritional_summary(recipe_json)
+                    recipe_text = json.dumps(recipe_json, ensure_ascii=False)
+                else:
+                    print("Warning: AI output is not a JSON object; nutrition not computed")
             # Save as formatted JSON file
             output_filename = f"{self.shortcode}.json"
             with open(output_filename, "w", encoding="utf-8") as f:
@@ -187,6 +244,31 @@ class ConvertReelToRecipe:
         
         return recipe_text
     
+    def add_nutritional_summary(self, recipe_json):
+        """
+        Adds a locally computed nutritional summary to a recipe.
+        
+        Ingredients without nutrition data are listed in the summary's
+        `unmatched_ingredients`, and `complete` is False, so an undercounted
+        total is never presented as complete.
+        
+        Args:
+            recipe_json: Parsed recipe dict with `ingredients` and `portions`
+            
+        Returns:
+            dict: The recipe with `nutritional_summary` set
+        """
+        summary, unmatched = nutrition.compute_nutritional_summary(
+            recipe_json.get("ingredients", []),
+            portions=recipe_json.get("portions", 1)
+        )
+        if unmatched:
+            print(f"Warning: No nutrition data for: {', '.join(unmatched)}")
+        summary["complete"] = not unmatched
+        summary["unmatched_ingredients"] = unmatched
+        recipe_json["nutritional_summary"] = summary
+        return recipe_json
+    
     def convert_video_to_audio(self, video_path):
         """
         Converts a video file to an audio file by extracting the audio track.
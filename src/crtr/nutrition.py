@@ -0,0 +1,283 @@
+"""Local nutrition computation from a precomputed per-100 g table."""
+
+import functools
+import json
+import os
+import re
+import unicodedata
+
+NUTRIENT_KEYS = (
+    "Energi_kcal",
+    "Protein_g",
+    "Fedt_g",
+    "Heraf_Mættet_Fedt_g",
+    "Kulhydrater_g",
+    "Heraf_Sukkerarter_g",
+    "Salt_g",
+)
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(__file__), "nutrition_table.json")
+
+# Volume units in millilitres
+_ML_PER_UNIT = {
+    "ml": 1.0,
+    "cl": 10.0,
+    "dl": 100.0,
+    "l": 1000.0,
+    "liter": 1000.0,
+    "spsk": 15.0,
+    "tsk": 5.0,
+}
+
+# Mass units in grams
+_G_PER_UNIT = {
+    "g": 1.0,
+    "gram": 1.0,
+    "mg": 0.001,
+    "kg": 1000.0,
+    "knivspids": 0.5,
+}
+
+_PIECE_UNITS = {"stk", "styk", "stykker", "fed", "skive", "skiver", "bundt", "dåse"}
+
+# Words that describe preparation rather than the ingredient itself
+_DESCRIPTORS = {
+    "frisk", "friske", "hakket", "hakkede", "finthakket", "finthakkede", "revet", "revne",
+    "skåret", "skårne", "stor", "store", "lille", "små", "mellemstor", "mellemstore",
+    "økologisk", "økologiske", "kogt", "kogte", "tørret", "tørrede", "smeltet", "blødt",
+    "koldt", "kold", "varm", "varmt", "evt", "ca",
+}
+
+
+def normalize_name(name):
+    """
+    Normalise a Danish ingredient name for table lookup.
+
+    Lowercases, removes parenthesised notes and punctuation, strips accents
+    (while keeping æ, ø and å) and collapses whitespace.
+
+    Args:
+        name: Raw ingredient name, e.g. "Crème fraîche (18%)"
+
+    Returns:
+        str: Normalised name, e.g. "creme fraiche"
+    """
+    s = (name or "").lower()
+    s = re.sub(r"\(.*?\)", " ", s)
+    s = "".join(
+        c if c in "æøå" else unicodedata.normalize("NFKD", c)
+        for c in unicodedata.normalize("NFC", s)
+    )
+    s = "".join(c for c in s if not unicodedata.combining(c))
+    s = re.sub(r"[^\wæøå ]+", " ", s)
+    s = re.sub(r"\d+", " ", s)
+    return " ".join(s.split())
+
+
+class NutritionTable:
+    """
+    A lookup table of per-100 g nutrient values with a Danish name index.
+
+    Each food row holds the values for ``NUTRIENT_KEYS`` followed by its density
+    (``g_per_ml``) and typical piece weight (``g_per_stk``), used for converting
+    volume and piece quantities to grams.
+    """
+
+    def __init__(self, columns, foods, aliases=None):
+        """
+        Build the table and its name index.
+
+        Args:
+            columns: Column names for each row in ``foods``
+            foods: Mapping of canonical food name to its row of values
+            aliases: Mapping of alternative names to canonical names (None marks
+                ingredients that contribute no nutrition, e.g. water)
+        """
+        self.columns = list(columns)
+        self._rows = {}
+        self._index = {}
+        for name, row in foods.items():
+            key = normalize_name(name)
+            self._rows[key] = dict(zip(self.columns, row))
+            self._index[key] = key
+        for alias, target in (aliases or {}).items():
+            self._index[normalize_name(alias)] = normalize_name(target) if target else None
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_TABLE_PATH):
+        """
+        Load a table from a JSON file with ``columns``, ``foods`` and ``aliases`` keys.
+
+        Args:
+            path: Path to the JSON table (default: bundled table)
+
+        Returns:
+            NutritionTable: The loaded table
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["columns"], data["foods"], data.get("aliases"))
+
+    def _resolve(self, key):
+        """Return (found, canonical_key) for an already-normalised key."""
+        if key in self._index:
+            return True, self._index[key]
+        return False, None
+
+    def lookup(self, name):
+        """
+        Find the canonical table key for an ingredient name.
+
+        Tries the full normalised name, then without preparation words, then
+        common plural endings. Names that only partly match a food (e.g.
+        "hvid chokolade") are not found, so they are reported as unmatched.
+
+        Args:
+            name: Ingredient name as written in the recipe
+
+        Returns:
+            tuple: (found, key) where key is None for known zero-nutrition
+                ingredients or when the name is not found
+        """
+        key = normalize_name(name)
+        candidates = [key]
+        stripped = " ".join(w for w in key.split() if w not in _DESCRIPTORS)
+        candidates.append(stripped)
+        for suffix in ("erne", "ene", "er", "e", "r"):
+            if stripped.endswith(suffix) and len(stripped) > len(suffix) + 2:
+                candidates.append(stripped[: -len(suffix)])
+
+        for candidate in candidates:
+            if not candidate:
+                continue
+            found, canonical = self._resolve(candidate)
+            if found:
+                return True, canonical
+        return False, None
+
+    def to_grams(self, key, quantity, unit):
+        """
+        Convert an ingredient quantity to grams.
+
+        Args:
+            key: Canonical table key
+            quantity: Numerical amount
+            unit: Unit string ("g", "dl", "stk", ...)
+
+        Returns:
+            float: Weight in grams, or None if the unit cannot be converted
+                (e.g. a volume unit for a food without a known density)
+        """
+        row = self._rows[key]
+        unit = normalize_name(unit) or "stk"
+        if unit in _G_PER_UNIT:
+            return quantity * _G_PER_UNIT[unit]
+        if unit in _ML_PER_UNIT and row.get("g_per_ml"):
+            return quantity * _ML_PER_UNIT[unit] * row["g_per_ml"]
+        if unit in _PIECE_UNITS and row.get("g_per_stk"):
+            return quantity * row["g_per_stk"]
+        return None
+
+    def nutrients_for(self, key, grams):
+        """
+        Return the nutrient values for a given weight of a food.
+
+        Args:
+            key: Canonical table key
+            grams: Weight in grams
+
+        Returns:
+            dict: Nutrient values keyed by ``NUTRIENT_KEYS``
+        """
+        row = self._rows[key]
+        return {k: row[k] * grams / 100.0 for k in NUTRIENT_KEYS}
+
+
+@functools.lru_cache(maxsize=None)
+def load_nutrition_table(path=DEFAULT_TABLE_PATH):
+    """
+    Load and cache a nutrition table.
+
+    Args:
+        path: Path to the JSON table (default: bundled table)
+
+    Returns:
+        NutritionTable: The loaded table
+    """
+    return NutritionTable.from_file(path)
+
+
+def _round_summary(values):
+    """Round nutrient totals to the precision used in recipe output."""
+    return {
+        k: int(round(v)) if k == "Energi_kcal" else round(v, 1)
+        for k, v in values.items()
+    }
+
+
+def compute_nutritional_summary(ingredients, portions=1, table=None):
+    """
+    Computes the nutritional summary for a recipe from its ingredients.
+
+    Ingredients that are not in the table, have a missing or non-positive
+    quantity, or whose unit cannot be converted to grams, are skipped and
+    reported. Entries that are not dicts are reported as their string form.
+
+    Args:
+        ingredients: List of ingredient dicts with ``name``, ``quantity`` and ``unit``
+        portions: Number of portions the recipe yields (default: 1)
+        table: NutritionTable to use (default: bundled table)
+
+    Returns:
+        tuple: (summary, unmatched) where summary has ``total_recipe`` and
+            ``per_portion`` dicts, and unmatched lists the skipped ingredient names
+    """
+    if table is None:
+        table = load_nutrition_table()
+
+    if ingredients is None:
+        ingredients = []
+    elif not isinstance(ingredients, list):
+        ingredients = [ingredients]
+
+    totals = dict.fromkeys(NUTRIENT_KEYS, 0.0)
+    unmatched = []
+    for item in ingredients:
+        if not isinstance(item, dict):
+            unmatched.append(str(item))
+            continue
+
+        name = str(item.get("name") or "")
+        found, key = table.lookup(name)
+        if not found:
+            unmatched.append(name)
+            continue
+        if key is None:
+            continue
+
+        try:
+            quantity = float(item.get("quantity"))
+        except (TypeError, ValueError):
+            unmatched.append(name)
+            continue
+        if not quantity > 0:
+            unmatched.append(name)
+            continue
+
+        grams = table.to_grams(key, quantity, item.get("unit", ""))
+        if grams is None:
+            unmatched.append(name)
+            continue
+        for k, v in table.nutrients_for(key, grams).items():
+            totals[k] += v
+
+    try:
+        portions = max(int(portions), 1)
+    except (TypeError, ValueError):
+        portions = 1
+
+    summary = {
+        "total_recipe": _round_summary(totals),
+        "per_portion": _round_summary({k: v / portions for k, v in totals.items()}),
+    }
+    return summary, unmatched
@@ -1,16 +1,25 @@
-"""Prompt template for recipe generation."""
+"""Prompt templates for recipe generation.
 
-RECIPE_GENERATION_PROMPT = """
-You are an expert culinary assistant specializing in turning video transcripts and short descriptions into clear, well-structured, easy-to-follow recipe guides for a **Danish audience**. You are also responsible for estimating the nutritional content and offering supplementary serving suggestions.
+Both templates are built from the same parts; the variant without nutrition
+is used with local nutrition computation (see crtr.nutrition), which makes the
+model output shorter and the numbers deterministic.
+"""
 
-Your task is to analyze the provided TEXT DATA, which consists of a video transcript and an Instagram Reel description, and generate a complete recipe and nutritional summary in a **single JSON object**.
+_ROLE = "You are an expert culinary assistant specializing in turning video transcripts and short descriptions into clear, well-structured, easy-to-follow recipe guides for a **Danish audience**."
 
+_RULES = """
 ### CONSTRAINTS & FORMATTING RULES:
 1.  **Output Format (CRITICAL):** Must be a single, valid **JSON object**. Do not include any text, headers, or explanations outside of the JSON structure.
 2.  **Language:** All output values (titles, descriptions, section headers, instructions, ingredient names, etc.) must be written in **Danish**.
 3.  **Measurements (CRITICAL):** All measurements must be in the **metric system** (e.g., grams (g), milliliters (ml), deciliters (dl), pieces (stk)). **Do not use cups, ounces, pounds, or fluid ounces.**
 4.  **Recipe Title (CRITICAL):** The `title` field must contain a clear and descriptive title. **If a title is not obvious in the text data, generate one that is engaging and relevant to the dish.**
+"""
+
+# Only used with local nutrition, where names must match the nutrition table
+_INGREDIENT_NAME_RULE = """5.  **Ingredient Names:** Use short, plain Danish ingredient names (e.g., "løg", "hvedemel", "hakket oksekød") without preparation notes.
+"""
 
+_STRUCTURE = """
 ### JSON STRUCTURE REQUIREMENTS:
 
 The JSON object must contain the following top-level keys:
@@ -26,7 +35,9 @@ The JSON object must contain the following top-level keys:
 * `equipment`: (Array of Strings) A list of necessary kitchen tools/equipment (`Udstyr`).
 * `instructions`: (Array of Strings) A step-by-step list of instructions (`Fremgangsmåde`).
 * `serving_suggestions`: (Array of Strings) Creative ideas for side dishes, additions, or modifications (`Serveringsforslag`).
-* `nutritional_summary`: (Object) Contains two sub-objects for the estimated nutritional content:
+"""
+
+_NUTRITION_SECTION = """* `nutritional_summary`: (Object) Contains two sub-objects for the estimated nutritional content:
     * `total_recipe`: (Object) Nutritional values for the entire recipe.
     * `per_portion`: (Object) Nutritional values per estimated portion.
 
@@ -39,7 +50,13 @@ The JSON object must contain the following top-level keys:
 * `Kulhydrater_g`: (Number)
 * `Heraf_Sukkerarter_g`: (Number)
 * `Salt_g`: (Number)
+"""
+
+_NO_NUTRITION_SECTION = """
+Do not include any nutritional information.
+"""
 
+_TEXT_DATA = """
 ---
 
 ### TEXT DATA PROVIDED:
@@ -48,6 +65,27 @@ Description of the Reel:
 
 Transcription of the Reel audio:
 {transcript}
-
-Generate the complete recipe and nutritional analysis now.
 """
+
+RECIPE_GENERATION_PROMPT = (
+    "\n" + _ROLE
+    + " You are also responsible for estimating the nutritional content and offering supplementary serving suggestions.\n"
+    + "\nYour task is to analyze the provided TEXT DATA, which consists of a video transcript and an Instagram Reel description, and generate a complete recipe and nutritional summary in a **single JSON object**.\n"
+    + _RULES
+    + _STRUCTURE
+    + _NUTRITION_SECTION
+    + _TEXT_DATA
+    + "\nGenerate the complete recipe and nutritional analysis now.\n"
+)
+
+RECIPE_GENERATION_PROMPT_WITHOUT_NUTRITION = (
+    "\n" + _ROLE
+    + " You also offer supplementary serving suggestions.\n"
+    + "\nYour task is to analyze the provided TEXT DATA, which consists of a video transcript and an Instagram Reel description, and generate a complete recipe in a **single JSON object**.\n"
+    + _RULES
+    + _INGREDIENT_NAME_RULE
+    + _STRUCTURE
+    + _NO_NUTRITION_SECTION
+    + _TEXT_DATA
+    + "\nGenerate the complete recipe now.\n"
+)
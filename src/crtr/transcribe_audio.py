@@ -4,6 +4,8 @@ import enum
 import torch
 from faster_whisper import WhisperModel
 
+from .transcript import Transcript
+
 
 class ModelSize(enum.Enum):
     """Available Whisper model sizes."""
@@ -32,32 +34,38 @@ class TranscribeAudio:
         print(f"Initializing Whisper model ({model_size}) on {device}...")
         self.model = WhisperModel(model_size, device=device)
 
-    def transcribe(self, file_path):
+    def transcribe_segments(self, file_path):
         """
-        Transcribes the audio file at the given file path using the Whisper model.
+        Transcribes the audio file and keeps the per-segment details.
         
         Args:
             file_path: The path to the audio file to be transcribed
         
         Returns:
-            str: The transcribed text from the audio
+            Transcript: Segment timestamps, texts, confidence and detected language
         """
-        transcript = ""
         result = self.model.transcribe(file_path, beam_size=5)
+        info = None
     
         # Unpack if tuple (segments, info)
         if isinstance(result, tuple) and len(result) >= 1:
             segments = result[0]
+            if len(result) >= 2:
+                info = result[1]
         else:
             segments = result
             
-        # Some implementations return a generator; iterate and collect text safely
-        for seg in segments:
-            # seg is expected to have a .text attribute; fallback to dict access
-            text = getattr(seg, "text", None)
-            if text is None and isinstance(seg, dict):
-                text = seg.get("text")
-            if text:
-                transcript += text + " "
-
-        return transcript.strip()
+        # Some implementations return a generator; Transcript consumes it once
+        return Transcript.from_segments(segments, info)
+
+    def transcribe(self, file_path):
+        """
+        Transcribes the audio file at the given file path using the Whisper model.
+        
+        Args:
+            file_path: The path to the audio file to be transcribed
+        
+        Returns:
+            str: The transcribed text from the audio
+        """
+        return self.transcribe_segments(file_path).to_text()
@@ -0,0 +1,230 @@
+"""Columnar storage for transcription segments."""
+
+import glob
+import json
+import os
+import tempfile
+
+TRANSCRIPT_SUFFIX = ".transcript.json"
+
+_COLUMNS = ("start", "end", "text", "avg_logprob", "no_speech_prob")
+
+
+def _get(seg, name, default=None):
+    """Read a field from a segment object, falling back to dict access."""
+    value = getattr(seg, name, None)
+    if value is None and isinstance(seg, dict):
+        value = seg.get(name)
+    return default if value is None else value
+
+
+class Transcript:
+    """
+    A transcript stored as parallel per-segment columns.
+
+    Keeps the timestamps, confidence and detected language from Whisper, along
+    with the reel description, so the prompt input can be rebuilt without
+    transcribing again.
+    """
+
+    def __init__(self, start=None, end=None, text=None, avg_logprob=None,
+                 no_speech_prob=None, language=None, language_probability=None,
+                 description=None):
+        """
+        Initialize the transcript from column lists.
+
+        Args:
+            start: Segment start times in seconds
+            end: Segment end times in seconds
+            text: Segment texts
+            avg_logprob: Average token log probability per segment
+            no_speech_prob: Probability that a segment contains no speech
+            language: Detected language code (e.g. 'da')
+            language_probability: Confidence of the detected language
+            description: Instagram reel description/caption (optional)
+        """
+        self.start = list(start or [])
+        self.end = list(end or [])
+        self.text = list(text or [])
+        self.avg_logprob = list(avg_logprob or [])
+        self.no_speech_prob = list(no_speech_prob or [])
+        self.language = language
+        self.language_probability = language_probability
+        self.description = description
+
+        lengths = {len(getattr(self, c)) for c in _COLUMNS}
+        if len(lengths) > 1:
+            raise ValueError("Transcript columns must have the same length")
+
+    def __len__(self):
+        return len(self.text)
+
+    @classmethod
+    def from_segments(cls, segments, info=None, description=None):
+        """
+        Build a transcript from Whisper segments.
+
+        Args:
+            segments: Iterable of segment objects or dicts
+            info: Transcription info with `language` and `language_probability` (optional)
+            description: Instagram reel description/caption (optional)
+
+        Returns:
+            Transcript: The collected segments
+        """
+        columns = {c: [] for c in _COLUMNS}
+        for seg in segments:
+            columns["start"].append(float(_get(seg, "start", 0.0)))
+            columns["end"].append(float(_get(seg, "end", 0.0)))
+            columns["text"].append(_get(seg, "text", ""))
+            columns["avg_logprob"].append(float(_get(seg, "avg_logprob", 0.0)))
+            columns["no_speech_prob"].append(float(_get(seg, "no_speech_prob", 0.0)))
+
+        return cls(
+            language=_get(info, "language"),
+            language_probability=_get(info, "language_probability"),
+            description=description,
+            **columns
+        )
+
+    def filter(self, min_avg_logprob=None, max_no_speech_prob=None):
+        """
+        Return a transcript without low-confidence or no-speech segments.
+
+        Args:
+            min_avg_logprob: Drop segments with a lower average log probability
+            max_no_speech_prob: Drop segments with a higher no-speech probability
+
+        Returns:
+            Transcript: A new transcript with the remaining segments
+        """
+        keep = [
+            i for i in range(len(self))
+            if (min_avg_logprob is None or self.avg_logprob[i] >= min_avg_logprob)
+            and (max_no_speech_prob is None or self.no_speech_prob[i] <= max_no_speech_prob)
+        ]
+        return Transcript(
+            language=self.language,
+            language_probability=self.language_probability,
+            description=self.description,
+            **{c: [getattr(self, c)[i] for i in keep] for c in _COLUMNS}
+        )
+
+    def to_text(self):
+        """
+        Join the segment texts into a single transcript string.
+
+        Returns:
+            str: The transcript text
+        """
+        return " ".join(t for t in self.text if t).strip()
+
+    def to_dict(self):
+        """
+        Return the transcript as a JSON-serialisable dict of columns.
+
+        Returns:
+            dict: Columns plus `language`, `language_probability` and `description`
+        """
+        data = {c: getattr(self, c) for c in _COLUMNS}
+        data["language"] = self.language
+        data["language_probability"] = self.language_probability
+        data["description"] = self.description
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a transcript from a dict produced by `to_dict`.
+
+        Args:
+            data: Dict of columns
+
+        Returns:
+            Transcript: The transcript
+            
+        Raises:
+            ValueError: If the data is not a dict or the columns are inconsistent
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Transcript data must be a JSON object")
+        return cls(
+            language=data.get("language"),
+            language_probability=data.get("language_probability"),
+            description=data.get("description"),
+            **{c: data.get(c) for c in _COLUMNS}
+        )
+
+    def save(self, path):
+        """
+        Save the transcript as compact columnar JSON.
+
+        The file is written to a temporary file in the same directory and then
+        moved into place, so an interrupted save never leaves a truncated file.
+
+        Args:
+            path: Output file path
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a transcript saved with `save`.
+
+        Args:
+            path: Path to the transcript file
+
+        Returns:
+            Transcript: The loaded transcript
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def transcript_path(shortcode, directory="."):
+    """
+    Return the storage path for a reel's transcript.
+
+    Args:
+        shortcode: Instagram post shortcode
+        directory: Directory holding the transcripts (default: current directory)
+
+    Returns:
+        str: Path to the transcript file
+    """
+    return os.path.join(directory, f"{shortcode}{TRANSCRIPT_SUFFIX}")
+
+
+def load_transcripts(directory="."):
+    """
+    Lazily load all stored transcripts in a directory, for bulk reprocessing.
+
+    Files that cannot be read or are not valid transcripts are skipped with a
+    warning, so one bad file does not stop the whole run.
+
+    Args:
+        directory: Directory holding the transcripts (default: current directory)
+
+    Yields:
+        tuple: (shortcode, Transcript) for each stored transcript, sorted by shortcode
+    """
+    for path in sorted(glob.glob(os.path.join(glob.escape(directory), "*" + TRANSCRIPT_SUFFIX))):
+        shortcode = os.path.basename(path)[: -len(TRANSCRIPT_SUFFIX)]
+        try:
+            transcript = Transcript.load(path)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Warning: Skipping unreadable transcript {path}: {e}")
+            continue
+        yield shortcode, transcript
@@ -0,0 +1,255 @@
+"""Tests for the CRTR nutrition module."""
+
+import json
+import pytest
+from unittest.mock import patch
+from crtr import (
+    ConvertReelToRecipe,
+    NutritionTable,
+    compute_nutritional_summary,
+    load_nutrition_table,
+)
+from crtr.nutrition import NUTRIENT_KEYS, normalize_name
+
+
+@pytest.fixture
+def table():
+    """A small nutrition table for predictable results."""
+    columns = list(NUTRIENT_KEYS) + ["g_per_ml", "g_per_stk"]
+    foods = {
+        "mælk": [50, 3.0, 2.0, 1.0, 5.0, 5.0, 0.1, 1.0, None],
+        "æg": [140, 12.0, 10.0, 3.0, 0.0, 0.0, 0.3, None, 50],
+        "hvedemel": [350, 10.0, 1.0, 0.0, 70.0, 0.0, 0.0, 0.5, None],
+    }
+    aliases = {"mel": "hvedemel", "vand": None}
+    return NutritionTable(columns, foods, aliases)
+
+
+class TestNormalizeName:
+    """Test suite for ingredient name normalisation."""
+
+    def test_strips_accents_but_keeps_danish_letters(self):
+        """Test that accents are removed while æ, ø and å are kept."""
+        assert normalize_name("Crème Fraîche") == "creme fraiche"
+        assert normalize_name("Rødløg") == "rødløg"
+        assert normalize_name("Blåbær") == "blåbær"
+
+    def test_removes_notes_and_punctuation(self):
+        """Test that parenthesised notes, digits and punctuation are removed."""
+        assert normalize_name("Fløde (38%)") == "fløde"
+        assert normalize_name("  løg,   hakket ") == "løg hakket"
+
+
+class TestNutritionTable:
+    """Test suite for table lookup and unit conversion."""
+
+    def test_lookup_variants(self, table):
+        """Test lookup through aliases, descriptors and plurals."""
+        assert table.lookup("Mel") == (True, "hvedemel")
+        assert table.lookup("Mælk") == (True, "mælk")
+        assert table.lookup("store æg") == (True, "æg")
+        assert table.lookup("vand") == (True, None)
+        assert table.lookup("trøffel") == (False, None)
+
+    def test_lookup_does_not_match_partial_names(self, table):
+        """Test that a name sharing only one word with a food is not matched."""
+        assert table.lookup("kokosmælk") == (False, None)
+        assert table.lookup("mælk og æg") == (False, None)
+
+    def test_lookup_partial_names_in_bundled_table(self):
+        """Test that different foods sharing a word are not confused."""
+        table = load_nutrition_table()
+        assert table.lookup("hvid chokolade") == (False, None)
+        assert table.lookup("salt og peber") == (False, None)
+
+    def test_bundled_aliases_do_not_substitute_foods(self):
+        """Test that related but different foods have their own rows or stay unmatched."""
+        table = load_nutrition_table()
+        assert table.lookup("æggeblommer") == (True, "æggeblomme")
+        assert table.to_grams("æggeblomme", 2, "stk") == 34
+        assert table.lookup("frisk koriander") == (True, "koriander")
+        assert table.lookup("lime") == (True, "lime")
+        assert table.lookup("madlavningsfløde") == (False, None)
+        assert table.lookup("cherrytomater") == (False, None)
+
+    def test_to_grams(self, table):
+        """Test conversion of mass, volume and piece units to grams."""
+        assert table.to_grams("hvedemel", 0.5, "kg") == 500
+        assert table.to_grams("hvedemel", 2, "dl") == 100
+        assert table.to_grams("mælk", 1, "spsk") == 15
+        assert table.to_grams("æg", 2, "stk") == 100
+        assert table.to_grams("mælk", 2, "stk") is None
+
+    def test_to_grams_without_density(self, table):
+        """Test that volume units are not converted for foods without a density."""
+        assert table.to_grams("æg", 1, "dl") is None
+
+        summary, unmatched = compute_nutritional_summary(
+            [{"name": "æg", "quantity": 1, "unit": "dl"}], table=table
+        )
+        assert unmatched == ["æg"]
+        assert summary["total_recipe"]["Energi_kcal"] == 0
+
+
+class TestComputeNutritionalSummary:
+    """Test suite for computing the recipe nutritional summary."""
+
+    def test_totals_and_per_portion(self, table):
+        """Test that totals are summed and divided by portions."""
+        ingredients = [
+            {"name": "mælk", "quantity": 2, "unit": "dl"},
+            {"name": "æg", "quantity": 2, "unit": "stk"},
+            {"name": "vand", "quantity": 1, "unit": "dl"},
+        ]
+        summary, unmatched = compute_nutritional_summary(ingredients, portions=2, table=table)
+
+        assert unmatched == []
+        assert set(summary["total_recipe"]) == set(NUTRIENT_KEYS)
+        assert summary["total_recipe"]["Energi_kcal"] == 240
+        assert summary["total_recipe"]["Protein_g"] == 18.0
+        assert summary["per_portion"]["Energi_kcal"] == 120
+        assert summary["per_portion"]["Protein_g"] == 9.0
+
+    def test_unmatched_ingredients_are_reported(self, table):
+        """Test that unknown ingredients are skipped and reported."""
+        ingredients = [
+            {"name": "trøffel", "quantity": 10, "unit": "g"},
+            {"name": "mælk", "quantity": 100, "unit": "g"},
+        ]
+        summary, unmatched = compute_nutritional_summary(ingredients, table=table)
+
+        assert unmatched == ["trøffel"]
+        assert summary["total_recipe"]["Energi_kcal"] == 50
+
+    def test_missing_or_non_positive_quantity_is_unmatched(self, table):
+        """Test that matched foods without a usable quantity are reported."""
+        ingredients = [
+            {"name": "mælk", "quantity": None, "unit": "dl"},
+            {"name": "mel", "unit": "dl"},
+            {"name": "æg", "quantity": 0, "unit": "stk"},
+            {"name": "æg", "quantity": -1, "unit": "stk"},
+            {"name": "vand", "quantity": None, "unit": "dl"},
+        ]
+        summary, unmatched = compute_nutritional_summary(ingredients, table=table)
+
+        assert unmatched == ["mælk", "mel", "æg", "æg"]
+        assert summary["total_recipe"]["Energi_kcal"] == 0
+
+    def test_non_dict_ingredients_are_unmatched(self, table):
+        """Test that string ingredients or a non-list value are reported, not raised."""
+        summary, unmatched = compute_nutritional_summary(
+            ["2 dl mælk", {"name": "mælk", "quantity": 100, "unit": "g"}], table=table
+        )
+        assert unmatched == ["2 dl mælk"]
+        assert summary["total_recipe"]["Energi_kcal"] == 50
+
+        summary, unmatched = compute_nutritional_summary("2 dl mælk", table=table)
+        assert unmatched == ["2 dl mælk"]
+
+    def test_multi_word_names_are_unmatched(self):
+        """Test that names only partly matching a food end up in unmatched."""
+        ingredients = [
+            {"name": "hvid chokolade", "quantity": 100, "unit": "g"},
+            {"name": "salt og peber", "quantity": 1, "unit": "tsk"},
+            {"name": "smør", "quantity": 10, "unit": "g"},
+        ]
+        summary, unmatched = compute_nutritional_summary(ingredients)
+
+        assert unmatched == ["hvid chokolade", "salt og peber"]
+        assert summary["total_recipe"]["Energi_kcal"] == 74
+
+    def test_bundled_table(self):
+        """Test that the bundled table loads and resolves common ingredients."""
+        ingredients = [
+            {"name": "Hakket oksekød", "quantity": 500, "unit": "g"},
+            {"name": "Løg", "quantity": 1, "unit": "stk"},
+            {"name": "Hvidløg", "quantity": 2, "unit": "fed"},
+            {"name": "Olivenolie", "quantity": 1, "unit": "spsk"},
+        ]
+        summary, unmatched = compute_nutritional_summary(ingredients, portions=4)
+
+        assert unmatched == []
+        assert summary["total_recipe"]["Energi_kcal"] > 0
+
+
+class TestLocalNutritionConverter:
+    """Test suite for the converter with local nutrition enabled."""
+
+    def test_prompt_omits_nutrition(self):
+        """Test that the slim prompt does not ask for nutrition."""
+        converter = ConvertReelToRecipe(local_nutrition=True)
+        prompt = converter.build_prompt("Test description", "Test transcript")
+        assert "nutritional_summary" not in prompt
+
+    def test_prompts_share_rules(self):
+        """Test that both prompt variants carry the same rules and structure."""
+        full = ConvertReelToRecipe().build_prompt("Test description", "Test transcript")
+        slim = ConvertReelToRecipe(local_nutrition=True).build_prompt(
+            "Test description", "Test transcript"
+        )
+        assert "nutritional_summary" in full
+        for text in ("**Recipe Title (CRITICAL):**", "`serving_suggestions`", "Test transcript"):
+            assert text in full
+            assert text in slim
+        assert "**Ingredient Names:**" in slim
+        assert "**Ingredient Names:**" not in full
+
+    def test_add_nutritional_summary(self):
+        """Test that the summary is added to the recipe dict."""
+        converter = ConvertReelToRecipe(local_nutrition=True)
+        recipe = {"portions": 2, "ingredients": [{"name": "mælk", "quantity": 1, "unit": "l"}]}
+        recipe = converter.add_nutritional_summary(recipe)
+        assert "total_recipe" in recipe["nutritional_summary"]
+        assert "per_portion" in recipe["nutritional_summary"]
+        assert recipe["nutritional_summary"]["complete"] is True
+        assert recipe["nutritional_summary"]["unmatched_ingredients"] == []
+
+    def test_add_nutritional_summary_records_unmatched(self):
+        """Test that skipped ingredients are recorded in the recipe output."""
+        converter = ConvertReelToRecipe(local_nutrition=True)
+        recipe = {
+            "portions": 2,
+            "ingredients": [
+                {"name": "mælk", "quantity": 1, "unit": "l"},
+                {"name": "trøffel", "quantity": 10, "unit": "g"},
+            ],
+        }
+        summary = converter.add_nutritional_summary(recipe)["nutritional_summary"]
+        assert summary["complete"] is False
+        assert summary["unmatched_ingredients"] == ["trøffel"]
+
+    @patch("crtr.converter.generate_recipe_with_ai.generate_recipe_with_gemini")
+    def test_generate_recipe_with_string_ingredients(self, mock_generate, tmp_path, monkeypatch):
+        """Test that string ingredients are recorded as unmatched and the recipe saved."""
+        monkeypatch.chdir(tmp_path)
+        mock_generate.return_value = (
+            '{"title": "Pasta", "portions": 2, "ingredients": ["2 dl mælk", "1 løg"]}'
+        )
+        converter = ConvertReelToRecipe(local_nutrition=True)
+        converter.shortcode = "ABC123xyz"
+        converter.build_prompt("Test description", "Test transcript")
+
+        recipe_text = converter.generate_recipe(ai_model="model", api_key="key")
+
+        summary = json.loads(recipe_text)["nutritional_summary"]
+        assert summary["complete"] is False
+        assert summary["unmatched_ingredients"] == ["2 dl mælk", "1 løg"]
+        assert (tmp_path / "ABC123xyz.json").exists()
+
+    @patch("crtr.converter.generate_recipe_with_ai.generate_recipe_with_gemini")
+    def test_generate_recipe_with_non_object_json(self, mock_generate, tmp_path, monkeypatch):
+        """Test that valid JSON that is not an object does not raise."""
+        monkeypatch.chdir(tmp_path)
+        mock_generate.return_value = '[{"title": "Pasta"}]'
+        converter = ConvertReelToRecipe(local_nutrition=True)
+        converter.shortcode = "ABC123xyz"
+        converter.build_prompt("Test description", "Test transcript")
+
+        recipe_text = converter.generate_recipe(ai_model="model", api_key="key")
+
+        assert recipe_text == '[{"title": "Pasta"}]'
+        assert (tmp_path / "ABC123xyz.json").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
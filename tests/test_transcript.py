@@ -0,0 +1,212 @@
+"""Tests for the CRTR transcript module."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from crtr import ConvertReelToRecipe, TranscribeAudio, Transcript, load_transcripts
+from crtr.transcript import transcript_path
+
+
+@pytest.fixture
+def segments():
+    """Whisper-like segments, mixing objects and dicts."""
+    class Segment:
+        def __init__(self, start, end, text, avg_logprob, no_speech_prob):
+            self.start = start
+            self.end = end
+            self.text = text
+            self.avg_logprob = avg_logprob
+            self.no_speech_prob = no_speech_prob
+
+    return [
+        Segment(0.0, 2.5, " Først koger vi vand.", -0.2, 0.01),
+        {"start": 2.5, "end": 4.0, "text": " Musik", "avg_logprob": -1.5, "no_speech_prob": 0.9},
+        Segment(4.0, 6.0, " Så tilsætter vi pasta.", -0.3, 0.05),
+    ]
+
+
+class TestTranscript:
+    """Test suite for the Transcript class."""
+
+    def test_from_segments(self, segments):
+        """Test collecting segments and language info into columns."""
+        info = {"language": "da", "language_probability": 0.98}
+        transcript = Transcript.from_segments(iter(segments), info)
+
+        assert len(transcript) == 3
+        assert transcript.start == [0.0, 2.5, 4.0]
+        assert transcript.end == [2.5, 4.0, 6.0]
+        assert transcript.language == "da"
+        assert transcript.language_probability == 0.98
+        assert transcript.to_text() == "Først koger vi vand.  Musik  Så tilsætter vi pasta."
+
+    def test_filter(self, segments):
+        """Test dropping low-confidence and no-speech segments."""
+        transcript = Transcript.from_segments(segments)
+
+        assert len(transcript.filter(max_no_speech_prob=0.5)) == 2
+        assert len(transcript.filter(min_avg_logprob=-0.25)) == 1
+        assert transcript.filter(max_no_speech_prob=0.5).start == [0.0, 4.0]
+        assert len(transcript) == 3
+
+    def test_mismatched_columns(self):
+        """Test that columns of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            Transcript(start=[0.0], end=[], text=["a"], avg_logprob=[0.0], no_speech_prob=[0.0])
+
+    def test_save_and_load_round_trip(self, segments, tmp_path):
+        """Test that a saved transcript loads back unchanged."""
+        transcript = Transcript.from_segments(
+            segments, {"language": "da"}, description="Hurtig pasta"
+        )
+        path = transcript_path("ABC123xyz", str(tmp_path))
+        transcript.save(path)
+
+        loaded = Transcript.load(path)
+        assert loaded.to_dict() == transcript.to_dict()
+        assert loaded.description == "Hurtig pasta"
+
+    def test_load_transcripts(self, segments, tmp_path):
+        """Test bulk loading of stored transcripts from a directory."""
+        transcript = Transcript.from_segments(segments)
+        transcript.save(transcript_path("BBB", str(tmp_path)))
+        transcript.save(transcript_path("AAA", str(tmp_path)))
+        (tmp_path / "AAA.json").write_text("{}")
+
+        loaded = list(load_transcripts(str(tmp_path)))
+        assert [shortcode for shortcode, _ in loaded] == ["AAA", "BBB"]
+        assert all(len(t) == 3 for _, t in loaded)
+
+
+    def test_load_transcripts_skips_invalid_files(self, segments, tmp_path, capsys):
+        """Test that corrupt or invalid files are skipped with a warning."""
+        transcript = Transcript.from_segments(segments)
+        transcript.save(transcript_path("AAA", str(tmp_path)))
+        transcript.save(transcript_path("DDD", str(tmp_path)))
+        (tmp_path / "BBB.transcript.json").write_text('{"start":[0.0,2.5')
+        (tmp_path / "CCC.transcript.json").write_text('{"start":[0.0],"text":[]}')
+        (tmp_path / "CCD.transcript.json").write_text("[]")
+
+        loaded = list(load_transcripts(str(tmp_path)))
+
+        assert [shortcode for shortcode, _ in loaded] == ["AAA", "DDD"]
+        output = capsys.readouterr().out
+        for name in ("BBB", "CCC", "CCD"):
+            assert f"{name}.transcript.json" in output
+
+    def test_save_replaces_atomically(self, segments, tmp_path):
+        """Test that a failed save keeps the old file and leaves no temp files."""
+        path = transcript_path("AAA", str(tmp_path))
+        Transcript.from_segments(segments).save(path)
+
+        with patch("crtr.transcript.json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                Transcript.from_segments(segments[:1]).save(path)
+
+        assert len(Transcript.load(path)) == 3
+        assert [p.name for p in tmp_path.iterdir()] == ["AAA.transcript.json"]
+
+
+@pytest.fixture
+def mock_whisper(segments):
+    """Patch WhisperModel to return the fixture segments with language info."""
+    info = MagicMock(language="da", language_probability=0.98)
+    with patch("crtr.transcribe_audio.torch") as mock_torch, \
+            patch("crtr.transcribe_audio.WhisperModel") as mock_model_cls:
+        mock_torch.cuda.is_available.return_value = False
+        mock_model_cls.return_value.transcribe.side_effect = (
+            lambda *args, **kwargs: (iter(segments), info)
+        )
+        yield mock_model_cls
+
+
+class TestTranscribeAudio:
+    """Test suite for TranscribeAudio with a mocked Whisper model."""
+
+    def test_transcribe_segments_unpacks_info(self, mock_whisper):
+        """Test that (segments, info) results are unpacked into a Transcript."""
+        transcript = TranscribeAudio(model_size="tiny").transcribe_segments("audio.mp3")
+
+        mock_whisper.assert_called_once_with("tiny", device="cpu")
+        assert len(transcript) == 3
+        assert transcript.language == "da"
+        assert transcript.language_probability == 0.98
+        assert transcript.no_speech_prob == [0.01, 0.9, 0.05]
+
+    def test_transcribe_segments_without_info(self, segments, mock_whisper):
+        """Test that a plain segment iterable is accepted."""
+        mock_whisper.return_value.transcribe.side_effect = (
+            lambda *args, **kwargs: iter(segments)
+        )
+        transcript = TranscribeAudio().transcribe_segments("audio.mp3")
+
+        assert len(transcript) == 3
+        assert transcript.language is None
+
+    def test_transcribe_returns_text(self, mock_whisper):
+        """Test that transcribe still returns the joined segment text."""
+        text = TranscribeAudio().transcribe("audio.mp3")
+        assert text == "Først koger vi vand.  Musik  Så tilsætter vi pasta."
+
+
+class TestConverterTranscription:
+    """Test suite for transcript storage in the converter."""
+
+    def test_transcribe_audio_saves_transcript(self, mock_whisper, tmp_path, monkeypatch):
+        """Test that the transcript is saved per reel and the audio removed."""
+        monkeypatch.chdir(tmp_path)
+        audio_path = tmp_path / "ABC123xyz.mp3"
+        audio_path.write_bytes(b"")
+        converter = ConvertReelToRecipe()
+        converter.shortcode = "ABC123xyz"
+        converter.description = "Hurtig pasta"
+
+        text = converter.transcribe_audio(str(audio_path))
+
+        assert text == converter.transcript
+        assert not audio_path.exists()
+        stored = Transcript.load(tmp_path / "ABC123xyz.transcript.json")
+        assert stored.to_dict() == converter.segments.to_dict()
+        assert stored.description == "Hurtig pasta"
+
+    def test_transcribe_audio_save_failure(self, mock_whisper, tmp_path, monkeypatch):
+        """Test that a failed transcript save only warns and still cleans up."""
+        monkeypatch.chdir(tmp_path)
+        audio_path = tmp_path / "ABC123xyz.mp3"
+        audio_path.write_bytes(b"")
+        converter = ConvertReelToRecipe()
+        converter.shortcode = "ABC123xyz"
+
+        with patch.object(Transcript, "save", side_effect=OSError("disk full")):
+            text = converter.transcribe_audio(str(audio_path))
+
+        assert text == "Først koger vi vand.  Musik  Så tilsætter vi pasta."
+        assert not audio_path.exists()
+
+
+class TestPromptFromSegments:
+    """Test suite for building prompts from stored segments."""
+
+    def test_build_prompt_from_segments(self, segments):
+        """Test that filtered segments are left out of the prompt."""
+        converter = ConvertReelToRecipe()
+        transcript = Transcript.from_segments(segments, description="Hurtig pasta")
+
+        prompt = converter.build_prompt_from_segments(transcript, max_no_speech_prob=0.5)
+
+        assert "Hurtig pasta" in prompt
+        assert "Først koger vi vand." in prompt
+        assert "Musik" not in prompt
+
+    def test_build_prompt_from_segments_with_description(self, segments):
+        """Test that an explicit description overrides the stored one."""
+        converter = ConvertReelToRecipe()
+        transcript = Transcript.from_segments(segments, description="Hurtig pasta")
+
+        prompt = converter.build_prompt_from_segments(transcript, description="Ny tekst")
+
+        assert "Ny tekst" in prompt
+        assert "Hurtig pasta" not in prompt
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])